@@ -32,7 +32,7 @@ Advanced StateGraph example (for learning):
 # Standard library
 import os
 from datetime import datetime
-from time import perf_counter
+from time import monotonic, perf_counter
 from typing import Any, Literal, Optional
 
 # Load environment variables before anything else
@@ -183,6 +183,8 @@ OPENAI_CALL_LOGGING_ENABLED = _env_flag("OPENAI_CALL_LOGGING_ENABLED", "true")
 AGENT_EFFICIENCY_MODE = _env_flag("AGENT_EFFICIENCY_MODE", "true")
 AGENT_TRACE_ENABLED = _env_flag("AGENT_TRACE_ENABLED", "false")
 REACT_AGENT_RECURSION_LIMIT = max(3, _env_int("REACT_AGENT_RECURSION_LIMIT", 8))
+# How long (seconds) an identical agent request may reuse the previous answer
+AGENT_RESULT_CACHE_TTL_SECONDS = max(0, _env_int("AGENT_RESULT_CACHE_TTL_SECONDS", 60))
 
 # External MCP server URL for ticket management (hardcoded)
 TICKET_MCP_SERVER_URL = "https://yodrrscbpxqnslgugwow.supabase.co/functions/v1/mcp/a7f2b8c4-d3e9-4f1a-b5c6-e8d9f0123456"
@@ -440,7 +442,12 @@ class AgentService:
         # Ticket MCP client state (unused)
         self._ticket_mcp_client: Optional[MCPClient] = None
         self._ticket_mcp_tools_loaded = False
-    
+
+        # Last successful run, reused briefly while prompt and CSV data are unchanged
+        self._last_key: Optional[tuple] = None
+        self._last_response: Optional[AgentResponse] = None
+        self._last_expires_at = 0.0
+
     async def _ensure_ticket_mcp_connection(self):
         """No-op: external MCP tools not exposed."""
         return
@@ -471,6 +478,23 @@ class AgentService:
             "mit {\"rows\": [...]}."
         )
 
+    def _run_cache_key(self, request: AgentRequest) -> tuple:
+        """
+        Cheap fingerprint of everything that determines an agent answer.
+
+        The tools only read the CSV service, whose data changes solely when
+        a file is (re)loaded - so its load version stands in for the dataset.
+        Model settings are included so a config change never serves a stale
+        generation.
+        """
+        return (
+            request.prompt,
+            request.agent_type,
+            OPENAI_MODEL,
+            self.llm.temperature,
+            get_csv_ticket_service().version,
+        )
+
     def _build_csv_tools(self) -> list[StructuredTool]:
         """Build LangChain tools backed by CSVTicketService."""
         import json
@@ -630,6 +654,16 @@ class AgentService:
         Raises:
             ValueError: If agent execution fails
         """
+        # Repeated identical requests (e.g. dashboard refreshes) reuse the
+        # last generation instead of paying for another LLM round trip.
+        cache_key = self._run_cache_key(request)
+        if (
+            cache_key == self._last_key
+            and self._last_response is not None
+            and monotonic() < self._last_expires_at
+        ):
+            return self._last_response.model_copy(update={"created_at": datetime.now()})
+
         try:
             # Execute agent with user prompt
             if AGENT_TRACE_ENABLED:
@@ -691,13 +725,17 @@ class AgentService:
                     if hasattr(msg, 'name'):
                         tools_used.append(msg.name)
             
-            return AgentResponse(
+            response = AgentResponse(
                 result=agent_output,
                 agent_type=request.agent_type,
                 tools_used=list(set(tools_used)),
                 created_at=datetime.now()
             )
-            
+            self._last_key = cache_key
+            self._last_response = response
+            self._last_expires_at = monotonic() + AGENT_RESULT_CACHE_TTL_SECONDS
+            return response.model_copy()
+
         except Exception as e:
             return AgentResponse(
                 result="Agent execution failed. See error field for details.",
@@ -17,7 +17,7 @@ Key principles:
 
 import inspect
 import json
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 from functools import wraps
 from typing import Any, Callable, Optional, Union, get_args, get_origin, get_type_hints
@@ -54,12 +54,26 @@ class Operation:
     # MCP-specific
     mcp_enabled: bool = True
 
+    # Input schema is derived from the (immutable) handler signature, so it
+    # is built once on first use and shared by REST, MCP and tool listings
+    _mcp_input_schema: Optional[dict] = field(default=None, init=False, repr=False, compare=False)
+
     def __post_init__(self):
         """Extract parameter information from function signature."""
         if self.http_path is None:
             self.http_path = f"/api/{self.name}"
 
     def get_mcp_input_schema(self) -> dict:
+        """
+        Get the MCP input schema, building it on first call.
+
+        The returned dict is shared between callers - treat it as read-only.
+        """
+        if self._mcp_input_schema is None:
+            self._mcp_input_schema = self._build_mcp_input_schema()
+        return self._mcp_input_schema
+
+    def _build_mcp_input_schema(self) -> dict:
         """
         Generate MCP input schema from function signature and Pydantic models.
 
@@ -74,6 +88,7 @@ class Operation:
 
         properties = {}
         required = []
+        defs = {}
 
         for param_name, param in sig.parameters.items():
             if param_name == 'self':
@@ -86,6 +101,9 @@ class Operation:
             if inspect.isclass(param_type) and issubclass(param_type, BaseModel):
                 # Use Pydantic's schema generation
                 model_schema = param_type.model_json_schema()
+                # Nested models are emitted as "#/$defs/..." refs, which only
+                # resolve when $defs sits at the root of the input schema
+                defs.update(model_schema.pop("$defs", {}))
                 properties[param_name] = model_schema
 
                 # Pydantic models are usually required unless Optional
@@ -125,6 +143,9 @@ class Operation:
         if required:
             schema["required"] = required
 
+        if defs:
+            schema["$defs"] = defs
+
         return schema
 
     def _type_to_json_schema(self, python_type: type, param_name: str) -> dict:
@@ -16,10 +16,15 @@ Key insight: Define operation with type hints, get REST + MCP + validation autom
 """
 
 import asyncio
+import hashlib
 import json
+import logging
 import os
+import time
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
+from typing import Any
 from uuid import UUID
 
 # Load environment variables from .env file
@@ -48,10 +53,12 @@ from csv_data import Ticket, get_csv_ticket_service
 
 # FastMCP client for direct ticket MCP calls (no AI)
 from fastmcp import Client as MCPClient
+from fastmcp.exceptions import ToolError
 from mcp_handler import handle_mcp_request
 from operations import (
     CSV_TICKET_FIELDS,
     op_create_task,
+    op_create_tasks,
     op_delete_task,
     op_get_task,
     op_get_task_stats,
@@ -59,24 +66,72 @@ from operations import (
     op_update_task,
     task_service,
 )
-from usecase_demo import UsecaseDemoRunCreate, usecase_demo_run_service
+from usecase_demo import UsecaseDemoRun, UsecaseDemoRunCreate, usecase_demo_run_service
 from workbench_integration import _tool_registry, workbench_service
 
 # Ticket MCP server URL (same as in agents.py)
 TICKET_MCP_SERVER_URL = "https://yodrrscbpxqnslgugwow.supabase.co/functions/v1/mcp/a7f2b8c4-d3e9-4f1a-b5c6-e8d9f0123456"
 
-from pydantic import ValidationError
+import httpx2
+import orjson
+from mcp.shared.exceptions import MCPError
+from mcp.types import CONNECTION_CLOSED, INTERNAL_ERROR, REQUEST_TIMEOUT
+from pydantic import BaseModel, TypeAdapter, ValidationError
 from quart import Quart, jsonify, request, send_from_directory
+from quart.json.provider import DefaultJSONProvider
 from quart_cors import cors
 
 # Import Pydantic models and service
-from tasks import Task, TaskCreate, TaskFilter, TaskService, TaskStats, TaskUpdate
+from tasks import (
+    Task,
+    TaskBatchCreate,
+    TaskCreate,
+    TaskFilter,
+    TaskService,
+    TaskStats,
+    TaskUpdate,
+)
+from tickets import TicketPriority, TicketStatus
+
+logger = logging.getLogger(__name__)
 
 # ============================================================================
 # APPLICATION SETUP
 # ============================================================================
 
+class OrjsonJSONProvider(DefaultJSONProvider):
+    """
+    Quart JSON provider backed by orjson for request and response bodies.
+
+    Output matches the default provider: sorted keys and HTTP-date
+    datetimes (routed through the provider's default hook). Indented
+    (debug) output, other custom options and anything orjson rejects
+    (e.g. NaN literals in request bodies) fall back to the stdlib.
+    """
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        if kwargs and kwargs != {"separators": (",", ":")}:
+            return super().dumps(obj, **kwargs)
+
+        option = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            return orjson.dumps(obj, default=self.default, option=option).decode()
+        except orjson.JSONEncodeError:
+            return super().dumps(obj, **kwargs)
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        if kwargs:
+            return super().loads(s, **kwargs)
+        try:
+            return orjson.loads(s)
+        except orjson.JSONDecodeError:
+            return super().loads(s)
+
+
 app = Quart(__name__)
+app.json = OrjsonJSONProvider(app)
 app = cors(app, allow_origin="*")
 
 # Service instances live in operations.py so every interface shares them
@@ -91,6 +146,25 @@ def format_datetime(dt: datetime) -> str:
     return dt.isoformat()
 
 
+def json_model_response(model: BaseModel, status: int = 200):
+    """
+    Serialize a Pydantic model straight to a JSON response.
+
+    model_dump_json runs in pydantic-core in one pass, without the
+    intermediate dict of jsonify(model.model_dump(mode="json")). The parsed
+    JSON is the same, but the bytes are not: keys keep model field (and
+    dict insertion) order instead of being sorted, and non-ASCII text is
+    emitted as raw UTF-8 where jsonify's stdlib fallback escapes it.
+    """
+    return app.response_class(model.model_dump_json(), status=status, mimetype="application/json")
+
+
+# List serializers built once: one pydantic-core traversal per response
+# instead of a model_dump() call per item
+_TASK_LIST_ADAPTER = TypeAdapter(list[Task])
+_USECASE_RUN_LIST_ADAPTER = TypeAdapter(list[UsecaseDemoRun])
+
+
 # =========================================================================
 # UNIFIED OPERATIONS
 # Defined once in operations.py so REST, MCP, and agents share logic.
@@ -109,7 +183,7 @@ async def rest_list_tasks():
     try:
         filter_enum = TaskFilter(filter_param)
         tasks = await op_list_tasks(filter_enum)
-        return jsonify([task.model_dump() for task in tasks])
+        return jsonify(_TASK_LIST_ADAPTER.dump_python(tasks))
     except ValueError:
         return jsonify({"error": f"Invalid filter: {filter_param}"}), 400
 
@@ -128,6 +202,20 @@ async def rest_create_task():
         return jsonify({"error": str(e)}), 500
 
 
+@app.route("/api/tasks/batch", methods=["POST"])
+async def rest_create_tasks():
+    """REST wrapper: create several tasks in one transaction."""
+    try:
+        data = await request.get_json()
+        batch = TaskBatchCreate(**data)
+        tasks = await op_create_tasks(batch)
+        return jsonify(_TASK_LIST_ADAPTER.dump_python(tasks)), 201
+    except ValidationError as e:
+        return jsonify({"error": str(e)}), 400
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+
 @app.route("/api/tasks/<task_id>", methods=["GET"])
 async def rest_get_task(task_id: str):
     """REST wrapper: get task by ID."""
@@ -377,7 +465,7 @@ async def create_usecase_demo_agent_run():
         data = await request.get_json() or {}
         payload = UsecaseDemoRunCreate(**data)
         run = await usecase_demo_run_service.create_run(payload)
-        return jsonify(run.model_dump(mode="json")), 202
+        return json_model_response(run, 202)
     except ValidationError as e:
         return jsonify({"error": str(e)}), 400
     except Exception as e:
@@ -390,7 +478,7 @@ async def list_usecase_demo_agent_runs():
     try:
         limit = request.args.get("limit", default=20, type=int)
         runs = await usecase_demo_run_service.list_runs(limit=limit or 20)
-        return jsonify({"runs": [run.model_dump(mode="json") for run in runs]}), 200
+        return jsonify({"runs": _USECASE_RUN_LIST_ADAPTER.dump_python(runs, mode="json")}), 200
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -402,7 +490,7 @@ async def get_usecase_demo_agent_run(run_id: str):
         run = await usecase_demo_run_service.get_run(run_id)
         if run is None:
             return jsonify({"error": "Run not found"}), 404
-        return jsonify(run.model_dump(mode="json")), 200
+        return json_model_response(run)
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -411,12 +499,200 @@ async def get_usecase_demo_agent_run(run_id: str):
 # TICKET MCP EXAMPLE - Direct FastMCP client usage (no AI)
 # ============================================================================
 
+# Read-only Ticket MCP tools and how long (seconds) their results may be
+# served from memory. Repeated dashboard refreshes then skip the network.
+_TICKET_TOOL_TTLS: dict[str, float] = {
+    "list_tickets": 5.0,
+    "search_tickets": 5.0,
+    "get_ticket": 5.0,
+    "get_ticket_stats": 30.0,
+}
+
+
+class _TicketToolCache:
+    """
+    Bounded TTL cache for Ticket MCP tool results.
+
+    Keys are the tool name plus the canonical JSON of its arguments, so
+    nested search filters work too. Only touched from the event loop, so
+    plain dict operations need no lock.
+    """
+
+    def __init__(self, maxsize: int = 256):
+        self._maxsize = maxsize
+        self._entries: OrderedDict[str, tuple[float, list[dict]]] = OrderedDict()
+
+    @staticmethod
+    def make_key(tool_name: str, args: dict) -> str:
+        return f"{tool_name}:{json.dumps(args, sort_keys=True, default=str)}"
+
+    def get(self, key: str) -> list[dict] | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, results = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return results
+
+    def put(self, key: str, results: list[dict], ttl: float) -> None:
+        self._entries[key] = (time.monotonic() + ttl, results)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+_ticket_tool_cache = _TicketToolCache()
+_ticket_tool_inflight: dict[str, asyncio.Future] = {}
+
+
+# One long-lived connection to the Ticket MCP server, opened on first use
+# and closed when the app stops serving (instead of a handshake per call).
+# Entering it in one request and exiting it at shutdown relies on fastmcp
+# running the session in a background task
+_ticket_mcp_client: MCPClient | None = None
+
+
+async def _get_ticket_mcp_client() -> MCPClient:
+    """Return the shared Ticket MCP client, (re)connecting it if needed."""
+    global _ticket_mcp_client
+    if _ticket_mcp_client is not None and not _ticket_mcp_client.is_connected():
+        # The session died (server restart, dropped stream): start over
+        await _discard_ticket_mcp_client(_ticket_mcp_client)
+    if _ticket_mcp_client is None:
+        client = MCPClient(TICKET_MCP_SERVER_URL)
+        await client.__aenter__()
+        if _ticket_mcp_client is None:
+            _ticket_mcp_client = client
+        else:
+            # Another request connected first while we were awaiting
+            await client.__aexit__(None, None, None)
+    return _ticket_mcp_client
+
+
+async def _discard_ticket_mcp_client(client: MCPClient | None) -> None:
+    """Drop a shared connection that failed mid-call so the next call reconnects."""
+    global _ticket_mcp_client
+    if client is None or _ticket_mcp_client is not client:
+        return
+    _ticket_mcp_client = None
+    try:
+        await client.__aexit__(None, None, None)
+    except Exception:
+        # The transport is usually already broken; nothing left to clean up
+        logger.debug("Ignoring error while closing Ticket MCP client", exc_info=True)
+
+
+@app.after_serving
+async def _close_ticket_mcp_client() -> None:
+    """Close the shared Ticket MCP connection on shutdown."""
+    await _discard_ticket_mcp_client(_ticket_mcp_client)
+
+
+# Outbound throttling and retry policy for the Ticket MCP server: at most
+# _TICKET_MCP_CONCURRENCY calls in flight, calls started at least
+# _TICKET_MCP_MIN_INTERVAL seconds apart, and read-only tools retried with
+# doubling backoff on transient failures (429, 5xx, dropped connections)
+_TICKET_MCP_CONCURRENCY = 8
+_TICKET_MCP_MIN_INTERVAL = 0.05
+_TICKET_MCP_MAX_ATTEMPTS = 3
+_TICKET_MCP_RETRY_BASE_DELAY = 0.5
+_TICKET_MCP_RETRY_MAX_DELAY = 5.0
+
+_ticket_mcp_semaphore = asyncio.Semaphore(_TICKET_MCP_CONCURRENCY)
+_ticket_mcp_next_call_at = 0.0
+
+
+# JSON-RPC error codes the MCP client uses for transport trouble: the
+# streamable HTTP transport turns 429/5xx responses into INTERNAL_ERROR
+# and a dropped stream into CONNECTION_CLOSED
+_TRANSIENT_MCP_ERROR_CODES = frozenset({CONNECTION_CLOSED, INTERNAL_ERROR, REQUEST_TIMEOUT})
+
+
+def _is_transient_ticket_mcp_error(exc: BaseException) -> bool:
+    """
+    True for failures worth retrying: rate limits, server errors, lost connections.
+
+    fastmcp surfaces these as MCPError, as httpx2 errors, or as a
+    RuntimeError chained to one of those when (re)connecting fails.
+    Tool-level failures (fastmcp's ToolError) are never transient.
+    """
+    if isinstance(exc, MCPError):
+        return exc.error.code in _TRANSIENT_MCP_ERROR_CODES
+    if isinstance(exc, httpx2.HTTPStatusError):
+        status = exc.response.status_code
+        return status == 429 or status >= 500
+    if isinstance(exc, RuntimeError) and exc.__cause__ is not None:
+        return _is_transient_ticket_mcp_error(exc.__cause__)
+    return isinstance(exc, (httpx2.TransportError, OSError, asyncio.TimeoutError))
+
+
+async def _wait_for_ticket_mcp_slot() -> None:
+    """Space out call starts by _TICKET_MCP_MIN_INTERVAL (event loop only, no lock needed)."""
+    global _ticket_mcp_next_call_at
+    now = time.monotonic()
+    start_at = max(now, _ticket_mcp_next_call_at)
+    _ticket_mcp_next_call_at = start_at + _TICKET_MCP_MIN_INTERVAL
+    if start_at > now:
+        await asyncio.sleep(start_at - now)
+
+
+async def _fetch_ticket_mcp_tool(tool_name: str, args: dict) -> list[dict]:
+    """
+    Call one tool over the shared Ticket MCP connection and parse results.
+
+    Read-only tools (those in _TICKET_TOOL_TTLS) are retried on transient
+    errors; other tools may have side effects and fail on the first error.
+    """
+    attempts = _TICKET_MCP_MAX_ATTEMPTS if tool_name in _TICKET_TOOL_TTLS else 1
+    delay = _TICKET_MCP_RETRY_BASE_DELAY
+    for attempt in range(1, attempts + 1):
+        client = None
+        try:
+            async with _ticket_mcp_semaphore:
+                await _wait_for_ticket_mcp_slot()
+                client = await _get_ticket_mcp_client()
+                response = await client.call_tool(tool_name, args)
+            break
+        except Exception as exc:
+            if not isinstance(exc, ToolError) or (client is not None and not client.is_connected()):
+                # Only a tool-level error leaves the session known-good; after
+                # anything else retry (and serve later calls) over a fresh one
+                await _discard_ticket_mcp_client(client)
+            if attempt == attempts or not _is_transient_ticket_mcp_error(exc):
+                raise
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, _TICKET_MCP_RETRY_MAX_DELAY)
+
+    results = []
+    
+    # Extract text content from MCP response
+    if hasattr(response, 'content') and response.content:
+        for content_item in response.content:
+            # Only process TextContent items (use getattr for type safety)
+            text = getattr(content_item, 'text', None)
+            if text is not None and isinstance(text, str):
+                try:
+                    # Parse JSON if possible
+                    results.append(orjson.loads(text))
+                except orjson.JSONDecodeError:
+                    results.append({"text": text})
+    
+    return results
+
+
 async def _call_ticket_mcp_tool(tool_name: str, args: dict | None = None) -> list[dict]:
     """
     Helper: Call a tool on the Ticket MCP server and extract results.
     
     This demonstrates using FastMCP client programmatically without any AI.
-    The connection is opened, tool is called, and connection is closed.
+    Calls share one persistent connection. Results of read-only tools are cached briefly (see _TICKET_TOOL_TTLS);
+    callers must treat the returned data as read-only.
     
     Args:
         tool_name: Name of the MCP tool to call (e.g., "list_tickets")
@@ -426,26 +702,42 @@ async def _call_ticket_mcp_tool(tool_name: str, args: dict | None = None) -> lis
         List of parsed JSON results from the tool response
     """
     args = args or {}
-    results = []
-    
-    async with MCPClient(TICKET_MCP_SERVER_URL) as client:
-        response = await client.call_tool(tool_name, args)
-        
-        # Extract text content from MCP response
-        if hasattr(response, 'content') and response.content:
-            for content_item in response.content:
-                # Only process TextContent items (use getattr for type safety)
-                text = getattr(content_item, 'text', None)
-                if text is not None and isinstance(text, str):
-                    try:
-                        # Parse JSON if possible
-                        results.append(json.loads(text))
-                    except json.JSONDecodeError:
-                        results.append({"text": text})
-    
-    return results
-    
-    return results
+    ttl = _TICKET_TOOL_TTLS.get(tool_name)
+    if ttl is None:
+        return await _fetch_ticket_mcp_tool(tool_name, args)
+
+    key = _TicketToolCache.make_key(tool_name, args)
+    cached = _ticket_tool_cache.get(key)
+    if cached is not None:
+        return cached
+
+    # Single flight: concurrent misses for the same key share one fetch.
+    # shield() keeps a cancelled caller from cancelling the shared call.
+    fetch = _ticket_tool_inflight.get(key)
+    if fetch is None:
+        fetch = asyncio.ensure_future(_fetch_ticket_mcp_tool(tool_name, args))
+        _ticket_tool_inflight[key] = fetch
+        fetch.add_done_callback(lambda done: _store_ticket_tool_result(key, ttl, done))
+    return await asyncio.shield(fetch)
+
+
+def _store_ticket_tool_result(key: str, ttl: float, fetch: asyncio.Future) -> None:
+    """Done-callback for a shared fetch: cache successes, always release the key."""
+    _ticket_tool_inflight.pop(key, None)
+    if not fetch.cancelled() and fetch.exception() is None:
+        _ticket_tool_cache.put(key, fetch.result(), ttl)
+
+
+# Query params forwarded to the list_tickets MCP tool, with their converters
+_LIST_TICKET_PARAMS: tuple[tuple[str, type], ...] = (
+    ("status", str),
+    ("priority", str),
+    ("city", str),
+    ("service", str),
+    ("search", str),
+    ("page", int),
+    ("page_size", int),
+)
 
 
 @app.route("/api/tickets", methods=["GET"])
@@ -463,34 +755,57 @@ async def rest_list_tickets():
         - page: Page number (default: 1)
         - page_size: Results per page (default: 20)
     """
+    # Build args from query params in one pass; bad numbers are a client error
+    args = {}
+    get_arg = request.args.get
+    for param, convert in _LIST_TICKET_PARAMS:
+        if val := get_arg(param):
+            try:
+                args[param] = convert(val)
+            except ValueError:
+                return jsonify({"error": f"Invalid {param}: {val}"}), 400
+
     try:
-        # Build args from query params
-        args = {}
-        for param in ["status", "priority", "city", "service", "search"]:
-            if val := request.args.get(param):
-                args[param] = val
-        for param in ["page", "page_size"]:
-            if val := request.args.get(param):
-                args[param] = int(val)
-        
         results = await _call_ticket_mcp_tool("list_tickets", args)
         return jsonify(results[0] if len(results) == 1 else results), 200
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
 
+# ETags of recently served tickets (ticket_id -> (etag, expires_at))
+_TICKET_ETAG_TTL = 5.0
+_TICKET_ETAG_MAXSIZE = 1024
+_ticket_etags: dict[str, tuple[str, float]] = {}
+
+
 @app.route("/api/tickets/<ticket_id>", methods=["GET"])
 async def rest_get_ticket(ticket_id: str):
     """
     Get a single ticket by ID from the Ticket MCP server.
     
     Demonstrates calling MCP tool with path parameter.
+    Supports If-None-Match: a recently served, unchanged ticket is
+    answered with 304 without calling the MCP server again.
     """
+    known = _ticket_etags.get(ticket_id)
+    if known and known[1] > time.monotonic() and request.if_none_match.contains(known[0]):
+        return "", 304, {"ETag": f'"{known[0]}"'}
+
     try:
         results = await _call_ticket_mcp_tool("get_ticket", {"ticket_id": ticket_id})
         if not results:
             return jsonify({"error": "Ticket not found"}), 404
-        return jsonify(results[0]), 200
+
+        etag = hashlib.blake2b(
+            orjson.dumps(results[0], option=orjson.OPT_SORT_KEYS), digest_size=16
+        ).hexdigest()
+        if len(_ticket_etags) >= _TICKET_ETAG_MAXSIZE:
+            _ticket_etags.clear()
+        _ticket_etags[ticket_id] = (etag, time.monotonic() + _TICKET_ETAG_TTL)
+
+        response = jsonify(results[0])
+        response.set_etag(etag)
+        return await response.make_conditional(request)
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -538,6 +853,13 @@ async def rest_search_tickets():
 # ============================================================================
 
 
+# Display labels for the known MCP values, computed once from the enums.
+# Unknown values fall back to the same string transforms at call time.
+_FRONTEND_PRIORITIES = {p.value: p.value.capitalize() for p in TicketPriority}
+_FRONTEND_STATUSES = {s.value: s.value.replace("_", " ").title() for s in TicketStatus}
+_ESCALATION_PRIORITIES = frozenset({"Critical", "High"})
+
+
 def _map_mcp_ticket_to_frontend(mcp_ticket: dict) -> dict:
     """
     Pure function: Map MCP ticket schema to frontend expected format.
@@ -550,14 +872,18 @@ def _map_mcp_ticket_to_frontend(mcp_ticket: dict) -> dict:
       - priority (lowercase) -> Priority (capitalized)
       - status (lowercase) -> status (capitalized)
     """
-    priority_raw = mcp_ticket.get("priority", "medium")
-    priority = priority_raw.capitalize() if priority_raw else "Medium"
+    priority_raw = mcp_ticket.get("priority")
+    priority = _FRONTEND_PRIORITIES.get(priority_raw)
+    if priority is None:
+        priority = priority_raw.capitalize() if priority_raw else "Medium"
     
-    status_raw = mcp_ticket.get("status", "new")
-    status = status_raw.replace("_", " ").title() if status_raw else "New"
+    status_raw = mcp_ticket.get("status")
+    status = _FRONTEND_STATUSES.get(status_raw)
+    if status is None:
+        status = status_raw.replace("_", " ").title() if status_raw else "New"
     
     # Derive escalationNeeded from priority
-    escalation_needed = priority in ("Critical", "High")
+    escalation_needed = priority in _ESCALATION_PRIORITIES
     
     return {
         "id": str(mcp_ticket.get("id", "")),
@@ -574,13 +900,23 @@ def _map_mcp_ticket_to_frontend(mcp_ticket: dict) -> dict:
     }
 
 
+_UNASSIGNED_STATUSES = frozenset({TicketStatus.NEW.value, TicketStatus.ASSIGNED.value})
+
+
 def _is_unassigned_ticket(ticket: dict) -> bool:
     """Pure function: Check if ticket is assigned to group but has no individual assignee."""
-    has_group = ticket.get("assigned_group") is not None
-    no_assignee = ticket.get("assignee") is None
-    status = ticket.get("status", "")
-    is_open_status = status in ("new", "assigned")
-    return has_group and no_assignee and is_open_status
+    # Most tickets are rejected on status, so check it first and stop early
+    status = ticket.get("status")
+    if not status or not isinstance(status, str):
+        return False
+    # MCP sends lowercase; only allocate a lowered copy for other casings
+    if not status.islower():
+        status = status.lower()
+    return (
+        status in _UNASSIGNED_STATUSES
+        and ticket.get("assignee") is None
+        and ticket.get("assigned_group") is not None
+    )
 
 
 @app.route("/api/qa-tickets", methods=["GET"])
@@ -832,7 +1168,7 @@ async def get_csv_tickets_sla_breach():
         has_assignee=False if unassigned_only else None,
     )
     report = get_sla_breach_report(tickets, reference_time=None, include_ok=include_ok)
-    return jsonify(report.model_dump(mode="json"))
+    return json_model_response(report)
 
 
 @app.route("/api/health", methods=["GET"])
@@ -919,6 +1255,14 @@ async def mcp_json_rpc():
 # ============================================================================
 
 if __name__ == "__main__":
+    # Prefer uvloop's libuv event loop when available (not on Windows);
+    # the Docker image gets the same via hypercorn --worker-class uvloop
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
     # Initialize sample data
     num_tasks = task_service.initialize_sample_data()
 
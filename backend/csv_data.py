@@ -14,11 +14,12 @@ Following "Grokking Simplicity":
 
 import csv
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 from uuid import NAMESPACE_DNS, UUID, uuid5
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 from tickets import Ticket, TicketPriority, TicketStatus, TicketWithDetails
 
 # ============================================================================
@@ -190,25 +191,39 @@ class CSVTicketRow(BaseModel):
 # CALCULATIONS - Pure transformations
 # ============================================================================
 
+# Date formats seen in the CSV exports, most common first
+CSV_DATETIME_FORMATS = (
+    "%d.%m.%Y %H:%M:%S",  # 22.10.2025 11:53:33
+    "%d.%m.%Y",           # 22.10.2025
+    "%Y-%m-%d %H:%M:%S",  # ISO format
+    "%Y-%m-%d",           # ISO date only
+)
+
+
 def parse_csv_datetime(date_str: Optional[str]) -> Optional[datetime]:
     """Parse datetime from CSV format (DD.MM.YYYY HH:MM:SS)."""
-    if not date_str or date_str.strip() == "":
+    if not date_str:
         return None
-    
-    # Try common formats
-    formats = [
-        "%d.%m.%Y %H:%M:%S",  # 22.10.2025 11:53:33
-        "%d.%m.%Y",           # 22.10.2025
-        "%Y-%m-%d %H:%M:%S",  # ISO format
-        "%Y-%m-%d",           # ISO date only
-    ]
-    
-    for fmt in formats:
+    return _parse_csv_datetime_cached(date_str.strip())
+
+
+@lru_cache(maxsize=8192)
+def _parse_csv_datetime_cached(date_str: str) -> Optional[datetime]:
+    """
+    Try each known format once per distinct string.
+
+    Exports repeat timestamps heavily (reported/modified dates, bulk
+    imports), and datetimes are immutable, so results are safe to share.
+    """
+    if not date_str:
+        return None
+
+    for fmt in CSV_DATETIME_FORMATS:
         try:
-            return datetime.strptime(date_str.strip(), fmt)
+            return datetime.strptime(date_str, fmt)
         except ValueError:
             continue
-    
+
     return None
 
 
@@ -349,6 +364,11 @@ def normalize_csv_headers(headers: list[str]) -> dict[str, str]:
 # ACTIONS - I/O operations
 # ============================================================================
 
+# Bulk (de)serializers, built once at import
+_TICKETS_ADAPTER = TypeAdapter(list[Ticket])
+_TICKETS_WITH_DETAILS_ADAPTER = TypeAdapter(list[TicketWithDetails])
+
+
 def load_tickets_from_csv(
     file_path: str | Path,
     encoding: str = "utf-8",
@@ -411,19 +431,12 @@ def load_tickets_with_details_from_csv(
     """
     Load tickets with empty work logs/modifications from CSV.
     
-    CSV doesn't contain work log data, so those are empty.
+    CSV doesn't contain work log data, so those are empty (model defaults).
+    Converted in one bulk dump/validate pass rather than per ticket.
     """
     tickets = load_tickets_from_csv(file_path, encoding)
     
-    return [
-        TicketWithDetails(
-            **ticket.model_dump(),
-            work_logs=[],
-            modifications=[],
-            overlay_metadata=None,
-        )
-        for ticket in tickets
-    ]
+    return _TICKETS_WITH_DETAILS_ADAPTER.validate_python(_TICKETS_ADAPTER.dump_python(tickets))
 
 
 # ============================================================================
@@ -442,6 +455,7 @@ class CSVTicketService:
         self._tickets: dict[UUID, Ticket] = {}
         self._tickets_by_incident_id: dict[str, Ticket] = {}
         self._loaded_files: set[str] = set()
+        self._version = 0
     
     def load_csv(self, file_path: str | Path) -> int:
         """
@@ -460,6 +474,7 @@ class CSVTicketService:
                 self._tickets_by_incident_id[ticket.incident_id] = ticket
         
         self._loaded_files.add(file_key)
+        self._version += 1
         return len(tickets)
     
     def get_ticket(self, ticket_id: UUID) -> Optional[Ticket]:
@@ -484,21 +499,13 @@ class CSVTicketService:
             assigned_group: Filter by assigned group
             has_assignee: True = has assignee, False = no assignee
         """
-        result = list(self._tickets.values())
-        
-        if status is not None:
-            result = [t for t in result if t.status == status]
-        
-        if assigned_group is not None:
-            result = [t for t in result if t.assigned_group == assigned_group]
-        
-        if has_assignee is not None:
-            if has_assignee:
-                result = [t for t in result if t.assignee is not None]
-            else:
-                result = [t for t in result if t.assignee is None]
-        
-        return result
+        # Single pass over the store - unset filters short-circuit to True
+        return [
+            t for t in self._tickets.values()
+            if (status is None or t.status == status)
+            and (assigned_group is None or t.assigned_group == assigned_group)
+            and (has_assignee is None or (t.assignee is not None) == has_assignee)
+        ]
     
     def get_unassigned_tickets(self) -> list[Ticket]:
         """Get tickets assigned to a group but without individual assignee."""
@@ -518,6 +525,11 @@ class CSVTicketService:
     def loaded_files(self) -> set[str]:
         """Set of loaded file paths."""
         return self._loaded_files.copy()
+    
+    @property
+    def version(self) -> int:
+        """Counter bumped on every load, including reloads of the same file."""
+        return self._version
 
 
 # ============================================================================
@@ -4,6 +4,7 @@ This module keeps all business operations in one place so every interface
 (REST, MCP, LangGraph agents) relies on the same validated logic.
 """
 
+import asyncio
 from collections import Counter
 from pathlib import Path
 from typing import Any
@@ -12,7 +13,15 @@ from uuid import UUID
 from agent_workbench import AgentDefinitionCreate, AgentDefinitionUpdate, AgentRunCreate
 from api_decorators import operation
 from csv_data import get_csv_ticket_service
-from tasks import Task, TaskCreate, TaskFilter, TaskService, TaskStats, TaskUpdate
+from tasks import (
+    Task,
+    TaskBatchCreate,
+    TaskCreate,
+    TaskFilter,
+    TaskService,
+    TaskStats,
+    TaskUpdate,
+)
 from tickets import (
     SlaBreachReport,
     Ticket,
@@ -101,6 +110,9 @@ def _get_workbench_service():
     return workbench_service
 
 
+# TaskService is synchronous SQLite I/O; run it in a worker thread so a
+# slow commit never blocks the event loop serving other requests.
+
 @operation(
     name="list_tasks",
     description="List all tasks with optional filtering by completion status",
@@ -109,7 +121,7 @@ def _get_workbench_service():
 )
 async def op_list_tasks(filter: TaskFilter = TaskFilter.ALL) -> list[Task]:
     """List tasks with optional filtering."""
-    return _task_service.list_tasks(filter)
+    return await asyncio.to_thread(_task_service.list_tasks, filter)
 
 
 @operation(
@@ -120,7 +132,18 @@ async def op_list_tasks(filter: TaskFilter = TaskFilter.ALL) -> list[Task]:
 )
 async def op_create_task(data: TaskCreate) -> Task:
     """Create a new task with validation."""
-    return _task_service.create_task(data)
+    return await asyncio.to_thread(_task_service.create_task, data)
+
+
+@operation(
+    name="create_tasks",
+    description="Create several tasks at once in a single transaction",
+    http_method="POST",
+    http_path="/api/tasks/batch",
+)
+async def op_create_tasks(data: TaskBatchCreate) -> list[Task]:
+    """Create several tasks in one batch."""
+    return await asyncio.to_thread(_task_service.create_tasks, data.tasks)
 
 
 @operation(
@@ -131,7 +154,7 @@ async def op_create_task(data: TaskCreate) -> Task:
 )
 async def op_get_task(task_id: str) -> Task | None:
     """Get a task by ID."""
-    return _task_service.get_task(task_id)
+    return await asyncio.to_thread(_task_service.get_task, task_id)
 
 
 @operation(
@@ -142,7 +165,7 @@ async def op_get_task(task_id: str) -> Task | None:
 )
 async def op_update_task(task_id: str, data: TaskUpdate) -> Task | None:
     """Update a task by ID."""
-    return _task_service.update_task(task_id, data)
+    return await asyncio.to_thread(_task_service.update_task, task_id, data)
 
 
 @operation(
@@ -153,7 +176,7 @@ async def op_update_task(task_id: str, data: TaskUpdate) -> Task | None:
 )
 async def op_delete_task(task_id: str) -> bool:
     """Delete a task by ID."""
-    return _task_service.delete_task(task_id)
+    return await asyncio.to_thread(_task_service.delete_task, task_id)
 
 
 @operation(
@@ -164,7 +187,7 @@ async def op_delete_task(task_id: str) -> bool:
 )
 async def op_get_task_stats() -> TaskStats:
     """Get task statistics."""
-    return _task_service.get_stats()
+    return await asyncio.to_thread(_task_service.get_stats)
 
 
 @operation(
@@ -490,6 +513,7 @@ __all__ = [
     "csv_ticket_service",
     "op_list_tasks",
     "op_create_task",
+    "op_create_tasks",
     "op_get_task",
     "op_update_task",
     "op_delete_task",
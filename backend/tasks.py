@@ -14,19 +14,59 @@ Following "Grokking Simplicity" and "A Philosophy of Software Design":
 - Clear separation: Data models, Calculations, Actions, Service layer
 """
 
+import os
+import threading
+import time
 import uuid
+from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
 from typing import Optional
 
 from pydantic import field_validator
-from sqlmodel import Field, Session, SQLModel, create_engine, select
+from sqlalchemy import case, event, func
+from sqlalchemy.orm import sessionmaker
+from sqlmodel import Field, Session, SQLModel, create_engine, delete, select, update
 
 # ============================================================================
 # DATA MODELS - SQLModel for database tables + Pydantic validation
 # ============================================================================
 
+def _generate_task_id() -> str:
+    """
+    Generate a time-ordered UUID (version 7 layout) as a string.
+
+    The millisecond timestamp prefix makes new ids sort after older ones,
+    so inserts append to the primary-key index instead of landing on
+    random pages. Still a valid UUID string like uuid4 ids.
+    """
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10), "big")
+    value = (value & ~(0xF << 76)) | (0x7 << 76)  # version 7
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)  # RFC 4122 variant
+    return str(uuid.UUID(int=value))
+
+
+# Shared field validators - one implementation reused by every task model.
+# None passes through so the same functions serve partial updates.
+
+def _clean_title(v: Optional[str]) -> Optional[str]:
+    """Strip the title and reject blank values."""
+    if v is None:
+        return None
+    v = v.strip()
+    if not v:
+        raise ValueError('Title cannot be empty or whitespace')
+    return v
+
+
+def _clean_description(v: Optional[str]) -> Optional[str]:
+    """Strip surrounding whitespace from the description."""
+    return v.strip() if v is not None else None
+
+
 class Task(SQLModel, table=True):
     """
     Complete task representation - both database table and Pydantic model.
@@ -39,19 +79,13 @@ class Task(SQLModel, table=True):
     - Provides IDE autocompletion
     """
     
-    id: Optional[str] = Field(default_factory=lambda: str(uuid.uuid4()), primary_key=True, description="Unique task identifier")
+    id: Optional[str] = Field(default_factory=_generate_task_id, primary_key=True, description="Unique task identifier")
     title: str = Field(..., min_length=1, max_length=200, description="Task title")
     description: str = Field(default="", max_length=1000, description="Task description")
-    completed: bool = Field(default=False, description="Completion status")
+    completed: bool = Field(default=False, index=True, description="Completion status")
     created_at: datetime = Field(default_factory=datetime.now, description="Creation timestamp")
 
-    @field_validator('title')
-    @classmethod
-    def title_not_empty(cls, v: str) -> str:
-        """Ensure title is not just whitespace."""
-        if not v.strip():
-            raise ValueError('Title cannot be empty or whitespace')
-        return v.strip()
+    title_not_empty = field_validator('title')(_clean_title)
 
 
 class TaskCreate(SQLModel):
@@ -63,17 +97,8 @@ class TaskCreate(SQLModel):
     title: str = Field(..., min_length=1, max_length=200, description="Task title")
     description: str = Field(default="", max_length=1000, description="Optional task description")
 
-    @field_validator('title')
-    @classmethod
-    def title_not_empty(cls, v: str) -> str:
-        if not v.strip():
-            raise ValueError('Title cannot be empty or whitespace')
-        return v.strip()
-
-    @field_validator('description')
-    @classmethod
-    def clean_description(cls, v: str) -> str:
-        return v.strip()
+    title_not_empty = field_validator('title')(_clean_title)
+    clean_description = field_validator('description')(_clean_description)
 
 
 class TaskUpdate(SQLModel):
@@ -86,17 +111,13 @@ class TaskUpdate(SQLModel):
     description: Optional[str] = Field(None, max_length=1000, description="New task description")
     completed: Optional[bool] = Field(None, description="New completion status")
 
-    @field_validator('title')
-    @classmethod
-    def title_not_empty(cls, v: Optional[str]) -> Optional[str]:
-        if v is not None and not v.strip():
-            raise ValueError('Title cannot be empty or whitespace')
-        return v.strip() if v else None
+    title_not_empty = field_validator('title')(_clean_title)
+    clean_description = field_validator('description')(_clean_description)
+
 
-    @field_validator('description')
-    @classmethod
-    def clean_description(cls, v: Optional[str]) -> Optional[str]:
-        return v.strip() if v else None
+class TaskBatchCreate(SQLModel):
+    """Data for creating several tasks in one call."""
+    tasks: list[TaskCreate] = Field(..., min_length=1, max_length=100, description="Tasks to create (at most 100)")
 
 
 class TaskFilter(str, Enum):
@@ -131,20 +152,185 @@ DATABASE_URL = f"sqlite:///{DB_PATH}"
 engine = create_engine(DATABASE_URL, echo=False)
 
 
+@event.listens_for(engine, "connect")
+def _set_sqlite_pragmas(dbapi_connection, _connection_record):
+    """
+    Tune each new SQLite connection for many small commits.
+
+    WAL + synchronous=NORMAL avoids an fsync of the main file per commit
+    while staying durable across application crashes.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA cache_size=-16000")  # ~16 MB page cache
+    cursor.close()
+
+
+# Session factory configured once. expire_on_commit=False keeps returned
+# tasks readable after their session closes without reloading them.
+SessionLocal = sessionmaker(bind=engine, class_=Session, expire_on_commit=False)
+
+
 def init_db():
     """Initialize database - create all tables."""
     SQLModel.metadata.create_all(engine)
+    # create_all skips indexes on tables that already exist, so add
+    # indexes introduced after a database was first created here
+    with engine.begin() as connection:
+        connection.exec_driver_sql("CREATE INDEX IF NOT EXISTS ix_task_completed ON task (completed)")
 
 
-def get_session():
+def get_session() -> Session:
     """Get database session."""
-    return Session(engine)
+    return SessionLocal()
 
 
 # Initialize database on module import
 init_db()
 
 
+class _TaskCache:
+    """
+    Bounded LRU of tasks by id, used by get_task.
+
+    Writes invalidate entries. A generation counter guards against a read
+    that started before an invalidation storing its (now stale) row.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self._maxsize = maxsize
+        self._entries: OrderedDict[str, Task] = OrderedDict()
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def get(self, task_id: str) -> Optional[Task]:
+        with self._lock:
+            task = self._entries.get(task_id)
+            if task is not None:
+                self._entries.move_to_end(task_id)
+            return task
+
+    def put(self, task: Task, generation: int) -> None:
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._entries[task.id] = task
+            self._entries.move_to_end(task.id)
+            if len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def discard(self, task_id: str) -> None:
+        with self._lock:
+            self._generation += 1
+            self._entries.pop(task_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+
+_task_cache = _TaskCache()
+
+
+class _StatsDelta:
+    """Change to the task counts made by one write, filled in after commit."""
+
+    __slots__ = ("completed", "total")
+
+    def __init__(self):
+        self.total = 0
+        self.completed = 0
+
+
+class _StatsCache:
+    """
+    Cached TaskStats, adjusted in step with writes instead of recounted.
+
+    Writes run inside write(). While any write is in flight no recount is
+    stored: one that ran after the commit would already include the row,
+    and the delta would then count it twice. The generation guard rejects
+    recounts that overlapped a write. Stored stats are replaced, never mutated.
+    """
+
+    def __init__(self):
+        self._stats: Optional[TaskStats] = None
+        self._generation = 0
+        self._writers = 0
+        self._lock = threading.Lock()
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def get(self) -> Optional[TaskStats]:
+        return self._stats
+
+    def put(self, stats: TaskStats, generation: int) -> None:
+        with self._lock:
+            if generation == self._generation and not self._writers:
+                self._stats = stats
+
+    @contextmanager
+    def write(self) -> Iterator[_StatsDelta]:
+        """
+        Bracket a write; the delta it records is applied when it finishes.
+
+        A write that raises drops the cached stats, since it is unknown
+        whether it committed.
+        """
+        with self._lock:
+            self._writers += 1
+        delta = _StatsDelta()
+        try:
+            yield delta
+        except BaseException:
+            with self._lock:
+                self._writers -= 1
+                self._generation += 1
+                self._stats = None
+            raise
+        with self._lock:
+            self._writers -= 1
+            self._generation += 1
+            if self._stats is not None and (delta.total or delta.completed):
+                new_total = self._stats.total + delta.total
+                new_completed = self._stats.completed + delta.completed
+                self._stats = TaskStats(
+                    total=new_total,
+                    completed=new_completed,
+                    pending=new_total - new_completed,
+                )
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._stats = None
+
+
+_stats_cache = _StatsCache()
+
+# list_tasks queries, built once per filter instead of on every call
+_LIST_STATEMENTS = {
+    TaskFilter.ALL: select(Task),
+    TaskFilter.COMPLETED: select(Task).where(Task.completed == True),  # noqa: E712
+    TaskFilter.PENDING: select(Task).where(Task.completed == False),  # noqa: E712
+}
+
+# Sample tasks as (title, description) - plain data, built once at import
+_SAMPLE_TASK_DATA: tuple[tuple[str, str], ...] = (
+    ("Learn Quart", "Explore the Quart web framework"),
+    ("Build React UI", "Create a modern UI with FluentUI"),
+    ("Write tests", "Add Playwright E2E tests"),
+)
+
+
 # ============================================================================
 # SERVICE LAYER - Business logic with consolidated operations
 # ============================================================================
@@ -170,20 +356,54 @@ class TaskService:
         - Timestamp creation
         - Database insertion
         """
+        # id and created_at come from default factories, so the instance is
+        # complete before insert and needs no refresh after commit
         task = Task.model_validate(data)
         
-        with get_session() as session:
+        with _stats_cache.write() as delta, get_session() as session:
             session.add(task)
             session.commit()
-            session.refresh(task)
-        
+            delta.total, delta.completed = 1, int(task.completed)
+
         return task
 
+    @staticmethod
+    def create_tasks(items: list[TaskCreate]) -> list[Task]:
+        """
+        Create several tasks in one transaction.
+
+        All items are validated before anything is written, and the batch
+        shares a single created_at timestamp and a single commit.
+        """
+        # TaskCreate already enforced the same constraints Task declares, so
+        # build table rows directly (table models skip validation in __init__)
+        now = datetime.now()
+        tasks = [
+            Task(title=item.title, description=item.description, created_at=now)
+            for item in items
+        ]
+
+        with _stats_cache.write() as delta, get_session() as session:
+            session.add_all(tasks)
+            session.commit()
+            delta.total = len(tasks)
+            delta.completed = sum(task.completed for task in tasks)
+
+        return tasks
+
     @staticmethod
     def get_task(task_id: str) -> Optional[Task]:
         """Get a task by ID. Returns None if not found."""
+        cached = _task_cache.get(task_id)
+        if cached is not None:
+            return cached
+
+        generation = _task_cache.generation
         with get_session() as session:
-            return session.get(Task, task_id)
+            task = session.get(Task, task_id)
+        if task is not None:
+            _task_cache.put(task, generation)
+        return task
 
     @staticmethod
     def list_tasks(filter: TaskFilter = TaskFilter.ALL) -> list[Task]:
@@ -193,14 +413,8 @@ class TaskService:
         Uses SQLModel's type-safe query builder.
         """
         with get_session() as session:
-            statement = select(Task)
-            
-            if filter == TaskFilter.COMPLETED:
-                statement = statement.where(Task.completed == True)  # noqa: E712
-            elif filter == TaskFilter.PENDING:
-                statement = statement.where(Task.completed == False)  # noqa: E712
-            
-            return list(session.exec(statement).all())
+            # .all() already returns a list - no extra copy needed
+            return session.exec(_LIST_STATEMENTS[filter]).all()
 
     @staticmethod
     def update_task(task_id: str, updates: TaskUpdate) -> Optional[Task]:
@@ -210,59 +424,98 @@ class TaskService:
         SQLModel handles validation and database updates.
         Returns None if task not found.
         """
-        with get_session() as session:
+        if updates.model_fields_set == {"completed"} and updates.completed is not None:
+            # Fast path for the common completion toggle: a single targeted
+            # UPDATE ... RETURNING that only matches when the value actually
+            # changes and hands back the updated row in the same statement
+            with _stats_cache.write() as delta, get_session() as session:
+                task = session.exec(
+                    update(Task)
+                    .where(Task.id == task_id, Task.completed != updates.completed)
+                    .values(completed=updates.completed)
+                    .returning(Task)
+                ).scalars().first()
+                session.commit()
+                if task is not None:
+                    delta.completed = 1 if updates.completed else -1
+            if task is None:
+                # Already in the requested state (or missing): nothing changed
+                return TaskService.get_task(task_id)
+            _task_cache.discard(task_id)
+            return task
+
+        with _stats_cache.write() as delta, get_session() as session:
             task = session.get(Task, task_id)
             if not task:
                 return None
 
+            was_completed = task.completed
+
             # Apply updates (only fields that were provided)
-            update_data = updates.model_dump(exclude_unset=True)
-            for key, value in update_data.items():
-                setattr(task, key, value)
+            for key in updates.model_fields_set:
+                setattr(task, key, getattr(updates, key))
             
             session.add(task)
             session.commit()
-            session.refresh(task)
+            _task_cache.discard(task_id)
+            delta.completed = int(task.completed) - int(was_completed)
             
             return task
 
     @staticmethod
     def delete_task(task_id: str) -> bool:
         """Delete a task. Returns True if deleted, False if not found."""
-        with get_session() as session:
+        with _stats_cache.write() as delta, get_session() as session:
             task = session.get(Task, task_id)
             if not task:
                 return False
             
+            was_completed = task.completed
             session.delete(task)
             session.commit()
+            _task_cache.discard(task_id)
+            delta.total, delta.completed = -1, -int(was_completed)
             return True
 
     @staticmethod
     def get_stats() -> TaskStats:
         """
-        Get task statistics using SQLModel queries.
+        Get task statistics.
+
+        Served from the cache when possible; otherwise counted in a single
+        aggregate query in SQLite - no rows are loaded into Python.
         """
-        with get_session() as session:
-            total = len(session.exec(select(Task)).all())
-            completed = len(session.exec(select(Task).where(Task.completed == True)).all())  # noqa: E712
+        cached = _stats_cache.get()
+        if cached is not None:
+            return cached
 
-            return TaskStats(
-                total=total,
-                completed=completed,
-                pending=total - completed
-            )
+        generation = _stats_cache.generation
+        with get_session() as session:
+            total, completed = session.exec(
+                select(
+                    func.count(Task.id),
+                    func.coalesce(func.sum(case((Task.completed == True, 1), else_=0)), 0),  # noqa: E712
+                )
+            ).one()
+
+        stats = TaskStats(
+            total=total,
+            completed=completed,
+            pending=total - completed
+        )
+        _stats_cache.put(stats, generation)
+        return stats
 
     @staticmethod
     def clear_all_tasks() -> int:
         """Clear all tasks. Returns count of tasks cleared."""
         with get_session() as session:
-            tasks = session.exec(select(Task)).all()
-            count = len(tasks)
-            for task in tasks:
-                session.delete(task)
+            # Single bulk DELETE - no rows are loaded or deleted one by one
+            result = session.exec(delete(Task))
             session.commit()
-            return count
+            _task_cache.clear()
+            _stats_cache.invalidate()
+            return result.rowcount
 
     @staticmethod
     def initialize_sample_data() -> int:
@@ -274,30 +527,15 @@ class TaskService:
         """
         # Only initialize samples if the database is empty.
         # Avoid clobbering existing user data.
-        stats = TaskService.get_stats()
-        if stats.total > 0:
-            return 0
-
-        # Create sample tasks
-        samples = [
-            TaskCreate(
-                title="Learn Quart",
-                description="Explore the Quart web framework"
-            ),
-            TaskCreate(
-                title="Build React UI",
-                description="Create a modern UI with FluentUI"
-            ),
-            TaskCreate(
-                title="Write tests",
-                description="Add Playwright E2E tests"
-            )
-        ]
-
-        for sample_data in samples:
-            TaskService.create_task(sample_data)
+        with get_session() as session:
+            if session.exec(select(func.count(Task.id))).one() > 0:
+                return 0
 
-        return len(samples)
+        created = TaskService.create_tasks([
+            TaskCreate(title=title, description=description)
+            for title, description in _SAMPLE_TASK_DATA
+        ])
+        return len(created)
 
 
 # ============================================================================
@@ -312,6 +550,7 @@ __all__ = [
     'Task',
     'TaskCreate',
     'TaskUpdate',
+    'TaskBatchCreate',
     'TaskFilter',
     'TaskStats',
     'TaskError',
@@ -9,6 +9,24 @@ def test_operation_registry():
     assert len(ops) > 0, "No operations registered!"
 
 
+def test_mcp_input_schema_is_built_once():
+    """Repeated schema lookups reuse the first generated schema."""
+    for op in get_operations().values():
+        schema = op.get_mcp_input_schema()
+        assert schema["type"] == "object"
+        assert op.get_mcp_input_schema() is schema
+
+
+def test_mcp_input_schema_refs_resolve_from_root():
+    """Nested model refs point at $defs hoisted to the schema root."""
+    schema = get_operations()["create_tasks"].get_mcp_input_schema()
+
+    items = schema["properties"]["data"]["properties"]["tasks"]["items"]
+    assert "$defs" not in schema["properties"]["data"]
+    assert items["$ref"] == "#/$defs/TaskCreate"
+    assert "TaskCreate" in schema["$defs"]
+
+
 def test_langchain_integration():
     """Test LangChain tool conversion."""
     if not LANGCHAIN_AVAILABLE:
@@ -18,3 +36,48 @@ def test_langchain_integration():
 
     tools = get_langchain_tools()
     assert len(tools) > 0
+
+
+def test_run_agent_reuses_last_generation(monkeypatch):
+    """Identical requests against unchanged CSV data skip the LLM round trip."""
+    import asyncio
+
+    import agents
+    from agents import AgentRequest, AgentService
+    from csv_data import get_csv_ticket_service
+
+    class _FinalMessage:
+        content = "done"
+
+    class _CountingAgent:
+        calls = 0
+
+        async def ainvoke(self, _payload, config=None):
+            self.calls += 1
+            return {"messages": [_FinalMessage()]}
+
+    service = AgentService()
+    service._react_agent = _CountingAgent()
+
+    async def _run(prompt: str):
+        return await service.run_agent(AgentRequest(prompt=prompt))
+
+    first = asyncio.run(_run("List open tickets"))
+    second = asyncio.run(_run("List open tickets"))
+    asyncio.run(_run("Count tickets"))
+
+    assert first.result == second.result == "done"
+    assert second.created_at >= first.created_at
+    assert second is not first
+    assert service._react_agent.calls == 2
+
+    # Reloading CSV data (even with the same row count) invalidates the memo
+    csv_service = get_csv_ticket_service()
+    monkeypatch.setattr(csv_service, "_version", csv_service.version + 1)
+    asyncio.run(_run("Count tickets"))
+    assert service._react_agent.calls == 3
+
+    # ... and so does the TTL running out
+    monkeypatch.setattr(agents, "monotonic", lambda: service._last_expires_at)
+    asyncio.run(_run("Count tickets"))
+    assert service._react_agent.calls == 4
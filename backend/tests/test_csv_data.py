@@ -0,0 +1,99 @@
+"""
+Tests for CSVTicketService filtering.
+
+Run from backend directory:
+    python -m pytest tests/test_csv_data.py
+"""
+
+from datetime import datetime
+from uuid import uuid4
+
+from csv_data import (
+    CSVTicketService,
+    load_tickets_with_details_from_csv,
+    parse_csv_datetime,
+)
+from tickets import Ticket, TicketPriority, TicketStatus
+
+
+def _ticket(status: TicketStatus, assigned_group: str | None, assignee: str | None) -> Ticket:
+    now = datetime(2025, 12, 17, 12, 0, 0)
+    return Ticket(
+        id=uuid4(),
+        summary="Sample",
+        description="Sample ticket",
+        status=status,
+        priority=TicketPriority.MEDIUM,
+        assignee=assignee,
+        assigned_group=assigned_group,
+        requester_name="Tester",
+        requester_email="tester@example.com",
+        created_at=now,
+        updated_at=now,
+    )
+
+
+def _service_with(tickets: list[Ticket]) -> CSVTicketService:
+    service = CSVTicketService()
+    service._tickets = {t.id: t for t in tickets}
+    return service
+
+
+def test_list_tickets_combined_filters():
+    """All filters apply together in one pass."""
+    match = _ticket(TicketStatus.ASSIGNED, "Network Team", None)
+    service = _service_with([
+        match,
+        _ticket(TicketStatus.ASSIGNED, "Network Team", "Agent Smith"),
+        _ticket(TicketStatus.NEW, "Network Team", None),
+        _ticket(TicketStatus.ASSIGNED, "DBA Team", None),
+    ])
+
+    result = service.list_tickets(
+        status=TicketStatus.ASSIGNED,
+        assigned_group="Network Team",
+        has_assignee=False,
+    )
+
+    assert result == [match]
+
+
+def test_list_tickets_without_filters_returns_all():
+    """No filters returns every ticket."""
+    tickets = [
+        _ticket(TicketStatus.NEW, None, None),
+        _ticket(TicketStatus.CLOSED, "DBA Team", "Agent Brown"),
+    ]
+    service = _service_with(tickets)
+
+    assert service.list_tickets() == tickets
+    assert service.list_tickets(has_assignee=True) == [tickets[1]]
+
+
+def test_parse_csv_datetime_formats():
+    """Known formats parse; blanks and unknown formats yield None."""
+    assert parse_csv_datetime("22.10.2025 11:53:33") == datetime(2025, 10, 22, 11, 53, 33)
+    assert parse_csv_datetime(" 22.10.2025 ") == datetime(2025, 10, 22)
+    assert parse_csv_datetime("2025-10-22 11:53:33") == datetime(2025, 10, 22, 11, 53, 33)
+    assert parse_csv_datetime("2025-10-22") == datetime(2025, 10, 22)
+    assert parse_csv_datetime("   ") is None
+    assert parse_csv_datetime(None) is None
+    assert parse_csv_datetime("yesterday") is None
+
+
+def test_load_tickets_with_details_from_csv(tmp_path):
+    """Detailed tickets keep every CSV field and start with empty details."""
+    csv_file = tmp_path / "tickets.csv"
+    csv_file.write_text(
+        "Incident ID*+,Summary*,Status*,Priority*,Reported Date\n"
+        "INC0001,VPN down,Assigned,High,22.10.2025 11:53:33\n"
+        "INC0002,Printer jam,Closed,Low,23.10.2025\n",
+        encoding="utf-8",
+    )
+
+    tickets = load_tickets_with_details_from_csv(csv_file)
+
+    assert [t.incident_id for t in tickets] == ["INC0001", "INC0002"]
+    assert tickets[0].status == TicketStatus.ASSIGNED
+    assert tickets[0].created_at == datetime(2025, 10, 22, 11, 53, 33)
+    assert all(t.work_logs == [] and t.modifications == [] and t.overlay_metadata is None for t in tickets)
@@ -0,0 +1,72 @@
+"""
+Tests for the orjson-backed Quart JSON provider.
+
+Run from backend directory:
+    python -m pytest tests/test_json_provider.py
+"""
+
+import json
+import math
+from datetime import datetime
+from uuid import UUID
+
+import app as backend_app_module
+from quart.json.provider import DefaultJSONProvider
+from tickets import TicketStatus
+
+
+def test_orjson_provider_matches_default_provider():
+    payload = {
+        "zeta": 1,
+        "alpha": [datetime(2025, 1, 2, 3, 4, 5), UUID(int=5), TicketStatus.NEW, "Zürich", None],
+    }
+    default = DefaultJSONProvider(backend_app_module.app)
+
+    fast = backend_app_module.app.json.dumps(payload, separators=(",", ":"))
+    slow = default.dumps(payload, separators=(",", ":"))
+
+    assert json.loads(fast) == json.loads(slow)
+    assert fast.index('"alpha"') < fast.index('"zeta"')
+    assert "Thu, 02 Jan 2025 03:04:05 GMT" in fast
+
+
+def test_orjson_provider_keeps_indented_output():
+    assert backend_app_module.app.json.dumps({"a": 1}, indent=2) == '{\n  "a": 1\n}'
+
+
+def test_orjson_provider_loads_request_bodies():
+    provider = backend_app_module.app.json
+
+    assert provider.loads(b'{"title": "Z\xc3\xbcrich", "n": [1, 2.5]}') == {"title": "Zürich", "n": [1, 2.5]}
+    assert math.isnan(provider.loads('{"value": NaN}')["value"])  # stdlib fallback
+
+
+def test_json_model_response_matches_model_dump():
+    import asyncio
+
+    from usecase_demo import UsecaseDemoRun
+
+    run = UsecaseDemoRun(id="run-1", prompt="Zürich tickets", result_rows=[{"a": 1}])
+
+    async def render():
+        async with backend_app_module.app.app_context():
+            response = backend_app_module.json_model_response(run, 202)
+            return response, await response.get_data()
+
+    response, body = asyncio.run(render())
+    assert response.status_code == 202
+    assert response.mimetype == "application/json"
+    assert json.loads(body) == run.model_dump(mode="json")
+
+
+def test_list_adapters_match_per_item_model_dump():
+    from tasks import Task
+    from usecase_demo import UsecaseDemoRun
+
+    runs = [UsecaseDemoRun(id=f"run-{i}", prompt="p", result_rows=[{"i": i}]) for i in range(3)]
+    tasks = [Task(id=f"t-{i}", title=f"Task {i}", created_at=datetime(2025, 1, i + 1)) for i in range(3)]
+
+    assert backend_app_module._USECASE_RUN_LIST_ADAPTER.dump_python(runs, mode="json") == [
+        run.model_dump(mode="json") for run in runs
+    ]
+    assert backend_app_module._TASK_LIST_ADAPTER.dump_python(tasks) == [task.model_dump() for task in tasks]
@@ -0,0 +1,223 @@
+"""
+Tests for TaskService against an isolated SQLite database.
+
+Run from backend directory:
+    python -m pytest tests/test_tasks.py
+"""
+
+import time
+from uuid import UUID
+
+import pytest
+import tasks
+from sqlmodel import SQLModel, create_engine
+from tasks import TaskCreate, TaskFilter, TaskService, TaskUpdate
+
+
+@pytest.fixture(autouse=True)
+def isolated_db(tmp_path, monkeypatch):
+    """Point the task service at a fresh database file per test."""
+    default_engine = tasks.engine
+    engine = create_engine(f"sqlite:///{tmp_path / 'tasks.db'}")
+    SQLModel.metadata.create_all(engine)
+    monkeypatch.setattr(tasks, "engine", engine)
+    tasks.SessionLocal.configure(bind=engine)
+    tasks._task_cache.clear()
+    tasks._stats_cache.invalidate()
+    yield engine
+    tasks.SessionLocal.configure(bind=default_engine)
+    tasks._task_cache.clear()
+    tasks._stats_cache.invalidate()
+    engine.dispose()
+
+
+def test_stats_on_empty_database():
+    stats = TaskService.get_stats()
+    assert (stats.total, stats.completed, stats.pending) == (0, 0, 0)
+
+
+def test_stats_count_completed_and_pending():
+    created = [TaskService.create_task(TaskCreate(title=f"Task {i}")) for i in range(3)]
+    TaskService.update_task(created[0].id, TaskUpdate(completed=True))
+
+    stats = TaskService.get_stats()
+    assert (stats.total, stats.completed, stats.pending) == (3, 1, 2)
+
+
+def test_clear_all_tasks_returns_deleted_count():
+    for i in range(2):
+        TaskService.create_task(TaskCreate(title=f"Task {i}"))
+
+    assert TaskService.clear_all_tasks() == 2
+    assert TaskService.list_tasks() == []
+    assert TaskService.clear_all_tasks() == 0
+
+
+def test_initialize_sample_data_only_seeds_empty_database():
+    seeded = TaskService.initialize_sample_data()
+
+    assert seeded > 0
+    assert TaskService.get_stats().total == seeded
+    assert len({task.created_at for task in TaskService.list_tasks()}) == 1
+    assert TaskService.initialize_sample_data() == 0
+    assert TaskService.get_stats().total == seeded
+
+
+def test_get_task_reflects_updates_and_deletes():
+    task = TaskService.create_task(TaskCreate(title="Cached"))
+    assert TaskService.get_task(task.id) is TaskService.get_task(task.id)
+
+    TaskService.update_task(task.id, TaskUpdate(title="Renamed"))
+    assert TaskService.get_task(task.id).title == "Renamed"
+
+    TaskService.delete_task(task.id)
+    assert TaskService.get_task(task.id) is None
+
+
+def test_cached_stats_follow_writes():
+    first = TaskService.create_task(TaskCreate(title="First"))
+    assert TaskService.get_stats().total == 1
+
+    second = TaskService.create_task(TaskCreate(title="Second"))
+    TaskService.update_task(first.id, TaskUpdate(completed=True))
+    stats = TaskService.get_stats()
+    assert (stats.total, stats.completed, stats.pending) == (2, 1, 1)
+
+    TaskService.delete_task(first.id)
+    TaskService.update_task(second.id, TaskUpdate(title="Renamed"))
+    stats = TaskService.get_stats()
+    assert (stats.total, stats.completed, stats.pending) == (1, 0, 1)
+
+    TaskService.clear_all_tasks()
+    assert TaskService.get_stats().total == 0
+
+
+def test_recount_between_commit_and_cache_update_is_not_double_counted(monkeypatch):
+    """A get_stats() that lands right after a write's commit must not be counted twice."""
+    real_commit = tasks.Session.commit
+    recounts = []
+
+    def commit_then_recount(session):
+        real_commit(session)
+        tasks._stats_cache.invalidate()  # force the next get_stats to hit the database
+        recounts.append(TaskService.get_stats().total)
+
+    with monkeypatch.context() as m:
+        m.setattr(tasks.Session, "commit", commit_then_recount)
+        task = TaskService.create_task(TaskCreate(title="Race"))
+        TaskService.get_stats()
+        TaskService.create_task(TaskCreate(title="Second"))
+        TaskService.update_task(task.id, TaskUpdate(completed=True))
+        TaskService.delete_task(task.id)
+
+    assert recounts == [1, 2, 2, 1]
+    stats = TaskService.get_stats()
+    assert (stats.total, stats.completed, stats.pending) == (1, 0, 1)
+
+
+def test_toggle_completed_updates_task_and_stats():
+    task = TaskService.create_task(TaskCreate(title="Toggle"))
+    TaskService.get_task(task.id)  # warm the cache
+
+    assert TaskService.update_task(task.id, TaskUpdate(completed=True)).completed is True
+    assert TaskService.update_task(task.id, TaskUpdate(completed=True)).completed is True
+    assert TaskService.get_stats().completed == 1
+
+    assert TaskService.update_task(task.id, TaskUpdate(completed=False)).completed is False
+    assert TaskService.get_stats().completed == 0
+
+    assert TaskService.update_task("missing", TaskUpdate(completed=True)) is None
+
+
+def test_toggle_completed_is_one_statement_returning_the_row(isolated_db):
+    from sqlalchemy import event
+
+    task = TaskService.create_task(TaskCreate(title="Toggle", description="Keep me"))
+    tasks._task_cache.clear()
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement.upper())
+
+    event.listen(isolated_db, "before_cursor_execute", record)
+    updated = TaskService.update_task(task.id, TaskUpdate(completed=True))
+    event.remove(isolated_db, "before_cursor_execute", record)
+    TaskService.delete_task(task.id)  # a later delete must not affect the returned row
+
+    assert len(statements) == 1
+    assert statements[0].lstrip().startswith("UPDATE") and "RETURNING" in statements[0]
+    assert (updated.id, updated.title, updated.description, updated.completed) == (task.id, "Toggle", "Keep me", True)
+
+
+def test_create_tasks_inserts_batch():
+    created = TaskService.create_tasks([TaskCreate(title="One"), TaskCreate(title="Two")])
+
+    assert [task.title for task in created] == ["One", "Two"]
+    assert created[0].created_at == created[1].created_at
+    assert TaskService.get_task(created[1].id).title == "Two"
+    assert TaskService.get_stats().total == 2
+
+
+def test_task_batch_size_is_capped():
+    from pydantic import ValidationError
+
+    assert len(tasks.TaskBatchCreate(tasks=[{"title": "t"}] * 100).tasks) == 100
+    with pytest.raises(ValidationError):
+        tasks.TaskBatchCreate(tasks=[{"title": "t"}] * 101)
+
+
+def test_task_ids_are_time_ordered_uuids():
+    first = TaskService.create_task(TaskCreate(title="First"))
+    time.sleep(0.002)
+    second = TaskService.create_task(TaskCreate(title="Second"))
+
+    assert UUID(first.id).version == 7
+    assert first.id < second.id
+
+
+def test_update_can_clear_description():
+    task = TaskService.create_task(TaskCreate(title="Described", description="Some text"))
+
+    updated = TaskService.update_task(task.id, TaskUpdate(description=""))
+
+    assert updated.description == ""
+
+
+def test_list_tasks_filters_by_completion():
+    done, pending = TaskService.create_tasks([TaskCreate(title="Done"), TaskCreate(title="Pending")])
+    TaskService.update_task(done.id, TaskUpdate(completed=True))
+
+    assert [t.id for t in TaskService.list_tasks(TaskFilter.COMPLETED)] == [done.id]
+    assert [t.id for t in TaskService.list_tasks(TaskFilter.PENDING)] == [pending.id]
+    assert len(TaskService.list_tasks(TaskFilter.ALL)) == 2
+
+
+def test_task_operations_run_off_the_event_loop(monkeypatch):
+    import asyncio
+    import threading
+
+    from operations import op_create_task, op_get_task, op_get_task_stats
+
+    service_threads = []
+
+    def record_thread(method):
+        def wrapper(*args):
+            service_threads.append(threading.get_ident())
+            return method(*args)
+        return staticmethod(wrapper)
+
+    for name in ("create_task", "get_task", "get_stats"):
+        monkeypatch.setattr(TaskService, name, record_thread(getattr(TaskService, name)))
+
+    async def scenario():
+        created = await op_create_task(TaskCreate(title="Async"))
+        fetched = await op_get_task(created.id)
+        stats = await op_get_task_stats()
+        return threading.get_ident(), created, fetched, stats
+
+    loop_thread, created, fetched, stats = asyncio.run(scenario())
+    assert fetched.title == "Async"
+    assert fetched.id == created.id
+    assert stats.total == 1
+    assert len(service_threads) == 3
+    assert loop_thread not in service_threads
@@ -0,0 +1,313 @@
+"""
+Tests for the Ticket MCP helpers in app.py (no network).
+
+Run from backend directory:
+    python -m pytest tests/test_ticket_mcp.py
+"""
+
+import asyncio
+import json
+import unittest
+from typing import ClassVar
+from unittest.mock import patch
+
+import app as backend_app_module
+import httpx2
+from fastmcp.exceptions import ToolError
+from mcp.shared.exceptions import MCPError
+from mcp.types import CONNECTION_CLOSED, INTERNAL_ERROR, INVALID_PARAMS
+
+
+class _TextContent:
+    def __init__(self, text: str) -> None:
+        self.text = text
+
+
+class _ToolResponse:
+    def __init__(self, payload: object) -> None:
+        self.content = [_TextContent(json.dumps(payload))]
+
+
+class _FakeMCPClient:
+    """Stands in for fastmcp.Client and records every tool call."""
+
+    calls: ClassVar[list[tuple[str, dict]]] = []
+    connects: int = 0
+    disconnects: int = 0
+    payload: object = {"tickets": []}
+
+    def __init__(self, url: str) -> None:
+        self.url = url
+        self.connected = False
+
+    async def __aenter__(self):
+        _FakeMCPClient.connects += 1
+        self.connected = True
+        return self
+
+    async def __aexit__(self, *exc_info):
+        _FakeMCPClient.disconnects += 1
+        self.connected = False
+        return False
+
+    def is_connected(self) -> bool:
+        return self.connected
+
+    async def call_tool(self, tool_name: str, args: dict):
+        _FakeMCPClient.calls.append((tool_name, args))
+        return _ToolResponse(_FakeMCPClient.payload)
+
+
+def _flaky_call_tool(outcomes: list):
+    """call_tool stand-in that raises or returns the given outcomes in order."""
+
+    async def call_tool(tool_name: str, args: dict):
+        _FakeMCPClient.calls.append((tool_name, args))
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    return call_tool
+
+
+class TicketMCPToolTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        _FakeMCPClient.calls = []
+        _FakeMCPClient.connects = 0
+        _FakeMCPClient.disconnects = 0
+        backend_app_module._ticket_mcp_client = None
+        _FakeMCPClient.payload = {"tickets": [{"id": "t-1", "status": "new"}]}
+        backend_app_module._ticket_tool_cache.clear()
+        backend_app_module._ticket_etags.clear()
+        patcher = patch.object(backend_app_module, "MCPClient", _FakeMCPClient)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(backend_app_module._ticket_tool_cache.clear)
+        self.addCleanup(setattr, backend_app_module, "_ticket_mcp_client", None)
+
+    async def test_read_only_tool_results_are_cached(self):
+        first = await backend_app_module._call_ticket_mcp_tool("list_tickets", {"status": "new"})
+        second = await backend_app_module._call_ticket_mcp_tool("list_tickets", {"status": "new"})
+
+        self.assertEqual(first, [{"tickets": [{"id": "t-1", "status": "new"}]}])
+        self.assertEqual(second, first)
+        self.assertEqual(len(_FakeMCPClient.calls), 1)
+
+    async def test_non_json_text_is_wrapped(self):
+        with patch.object(_FakeMCPClient, "call_tool", return_value=_ToolResponse(None)) as call_tool:
+            call_tool.return_value.content = [_TextContent("Ticket not found")]
+            results = await backend_app_module._call_ticket_mcp_tool("delete_ticket", {"ticket_id": "x"})
+
+        self.assertEqual(results, [{"text": "Ticket not found"}])
+
+    async def test_different_arguments_are_cached_separately(self):
+        await backend_app_module._call_ticket_mcp_tool("list_tickets", {"status": "new"})
+        await backend_app_module._call_ticket_mcp_tool("list_tickets", {"status": "closed"})
+
+        self.assertEqual(len(_FakeMCPClient.calls), 2)
+
+    async def test_expired_entries_are_refetched(self):
+        with patch.dict(backend_app_module._TICKET_TOOL_TTLS, {"list_tickets": 0.0}):
+            await backend_app_module._call_ticket_mcp_tool("list_tickets")
+            await backend_app_module._call_ticket_mcp_tool("list_tickets")
+
+        self.assertEqual(len(_FakeMCPClient.calls), 2)
+
+    async def test_calls_reuse_one_connection_until_shutdown(self):
+        await backend_app_module._call_ticket_mcp_tool("list_tickets", {"status": "new"})
+        await backend_app_module._call_ticket_mcp_tool("get_ticket", {"ticket_id": "t-1"})
+
+        self.assertEqual(len(_FakeMCPClient.calls), 2)
+        self.assertEqual(_FakeMCPClient.connects, 1)
+
+        await backend_app_module._close_ticket_mcp_client()
+        self.assertEqual(_FakeMCPClient.disconnects, 1)
+        self.assertIsNone(backend_app_module._ticket_mcp_client)
+
+    async def test_dead_session_is_replaced_before_the_next_call(self):
+        await backend_app_module._call_ticket_mcp_tool("get_ticket_stats")
+        stale = backend_app_module._ticket_mcp_client
+        stale.connected = False  # e.g. the server restarted
+
+        await backend_app_module._call_ticket_mcp_tool("get_ticket", {"ticket_id": "t-1"})
+
+        self.assertIsNot(backend_app_module._ticket_mcp_client, stale)
+        self.assertEqual(_FakeMCPClient.connects, 2)
+        self.assertEqual(len(_FakeMCPClient.calls), 2)
+
+    async def test_shutdown_ignores_a_broken_connection(self):
+        await backend_app_module._call_ticket_mcp_tool("get_ticket_stats")
+
+        with patch.object(_FakeMCPClient, "__aexit__", side_effect=ConnectionError("gone")):
+            await backend_app_module._close_ticket_mcp_client()
+
+        self.assertIsNone(backend_app_module._ticket_mcp_client)
+
+    async def test_concurrent_misses_share_one_fetch(self):
+        results = await asyncio.gather(
+            *(backend_app_module._call_ticket_mcp_tool("get_ticket_stats") for _ in range(5))
+        )
+
+        self.assertEqual(len(_FakeMCPClient.calls), 1)
+        self.assertTrue(all(result == results[0] for result in results))
+        self.assertEqual(backend_app_module._ticket_tool_inflight, {})
+
+    async def test_failed_fetch_is_not_cached(self):
+        with patch.object(_FakeMCPClient, "call_tool", side_effect=RuntimeError("boom")), \
+                self.assertRaises(RuntimeError):
+            await backend_app_module._call_ticket_mcp_tool("get_ticket_stats")
+
+        await backend_app_module._call_ticket_mcp_tool("get_ticket_stats")
+        self.assertEqual(len(_FakeMCPClient.calls), 1)
+
+    async def test_transient_errors_on_read_only_tools_are_retried(self):
+        outcomes = [
+            MCPError(INTERNAL_ERROR, "Server returned an error response"),  # e.g. a 503
+            httpx2.ConnectError("All connection attempts failed"),
+            _ToolResponse({"total": 3}),
+        ]
+
+        with patch.object(backend_app_module, "_TICKET_MCP_RETRY_BASE_DELAY", 0.0), \
+                patch.object(_FakeMCPClient, "call_tool", side_effect=_flaky_call_tool(outcomes)):
+            results = await backend_app_module._call_ticket_mcp_tool("get_ticket_stats")
+
+        self.assertEqual(results, [{"total": 3}])
+        self.assertEqual(len(_FakeMCPClient.calls), 3)
+        # Every retry ran over a freshly connected session
+        self.assertEqual(_FakeMCPClient.connects, 3)
+        self.assertEqual(_FakeMCPClient.disconnects, 2)
+
+    async def test_dropped_session_is_replaced_on_the_next_call(self):
+        # fastmcp reports a dead session as MCPError("Connection closed"); the
+        # write tool is not retried, but the next call must reconnect
+        outcomes = [MCPError(CONNECTION_CLOSED, "Connection closed"), _ToolResponse({"ok": True})]
+
+        with patch.object(_FakeMCPClient, "call_tool", side_effect=_flaky_call_tool(outcomes)):
+            with self.assertRaises(MCPError):
+                await backend_app_module._call_ticket_mcp_tool("update_ticket", {"ticket_id": "t-1"})
+            self.assertIsNone(backend_app_module._ticket_mcp_client)
+
+            results = await backend_app_module._call_ticket_mcp_tool("update_ticket", {"ticket_id": "t-1"})
+
+        self.assertEqual(results, [{"ok": True}])
+        self.assertEqual(_FakeMCPClient.connects, 2)
+        self.assertEqual(_FakeMCPClient.disconnects, 1)
+
+    async def test_tool_errors_keep_the_shared_session(self):
+        await backend_app_module._call_ticket_mcp_tool("get_ticket_stats")
+        client = backend_app_module._ticket_mcp_client
+
+        with patch.object(_FakeMCPClient, "call_tool", side_effect=ToolError("Ticket not found")), \
+                self.assertRaises(ToolError):
+            await backend_app_module._call_ticket_mcp_tool("get_ticket", {"ticket_id": "missing"})
+
+        self.assertIs(backend_app_module._ticket_mcp_client, client)
+        self.assertEqual(_FakeMCPClient.connects, 1)
+
+    async def test_write_tools_are_not_retried(self):
+        closed = MCPError(CONNECTION_CLOSED, "Connection closed")
+        with patch.object(backend_app_module, "_TICKET_MCP_RETRY_BASE_DELAY", 0.0), \
+                patch.object(_FakeMCPClient, "call_tool", side_effect=closed) as call_tool, \
+                self.assertRaises(MCPError):
+            await backend_app_module._call_ticket_mcp_tool("update_ticket", {"ticket_id": "t-1"})
+
+        self.assertEqual(call_tool.call_count, 1)
+
+    async def test_list_tickets_forwards_typed_query_params(self):
+        client = backend_app_module.app.test_client()
+
+        response = await client.get("/api/tickets?status=new&page=2&page_size=5&city=")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(_FakeMCPClient.calls, [("list_tickets", {"status": "new", "page": 2, "page_size": 5})])
+
+    async def test_list_tickets_rejects_non_numeric_page(self):
+        client = backend_app_module.app.test_client()
+
+        response = await client.get("/api/tickets?page=two")
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(_FakeMCPClient.calls, [])
+
+    async def test_get_ticket_answers_matching_etag_with_304(self):
+        _FakeMCPClient.payload = {"id": "t-1", "status": "new"}
+        client = backend_app_module.app.test_client()
+
+        first = await client.get("/api/tickets/t-1")
+        etag = first.headers["ETag"]
+        second = await client.get("/api/tickets/t-1", headers={"If-None-Match": etag})
+        stale = await client.get("/api/tickets/t-1", headers={"If-None-Match": '"other"'})
+
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(second.status_code, 304)
+        self.assertEqual(second.headers["ETag"], etag)
+        self.assertEqual(stale.status_code, 200)
+        self.assertEqual(len(_FakeMCPClient.calls), 1)
+
+
+def test_transient_error_classification_uses_mcp_client_exceptions():
+    is_transient = backend_app_module._is_transient_ticket_mcp_error
+    request = httpx2.Request("POST", "http://mcp.test")
+
+    def status_error(code: int) -> httpx2.HTTPStatusError:
+        return httpx2.HTTPStatusError("error", request=request, response=httpx2.Response(code, request=request))
+
+    def wrapped(cause: Exception) -> RuntimeError:
+        try:
+            raise RuntimeError(f"Client failed to connect: {cause}") from cause
+        except RuntimeError as exc:
+            return exc
+
+    assert is_transient(MCPError(CONNECTION_CLOSED, "Connection closed"))
+    assert is_transient(MCPError(INTERNAL_ERROR, "Server returned an error response"))
+    assert is_transient(httpx2.ConnectError("refused"))
+    assert is_transient(status_error(429))
+    assert is_transient(status_error(503))
+    assert is_transient(wrapped(httpx2.ConnectError("refused")))
+
+    assert not is_transient(MCPError(INVALID_PARAMS, "bad arguments"))
+    assert not is_transient(ToolError("Ticket not found"))
+    assert not is_transient(status_error(404))
+    assert not is_transient(RuntimeError("boom"))
+
+
+def test_map_mcp_ticket_to_frontend_labels():
+    mapped = backend_app_module._map_mcp_ticket_to_frontend(
+        {"id": 7, "summary": "VPN down", "priority": "high", "status": "in_progress"}
+    )
+
+    assert mapped["id"] == "7"
+    assert mapped["title"] == "VPN down"
+    assert mapped["priority"] == "High"
+    assert mapped["status"] == "In Progress"
+    assert mapped["escalationNeeded"] is True
+
+
+def test_map_mcp_ticket_to_frontend_defaults_and_unknown_values():
+    defaults = backend_app_module._map_mcp_ticket_to_frontend({})
+    assert (defaults["priority"], defaults["status"], defaults["escalationNeeded"]) == ("Medium", "New", False)
+
+    unknown = backend_app_module._map_mcp_ticket_to_frontend(
+        {"priority": "urgent", "status": "waiting_for_customer"}
+    )
+    assert (unknown["priority"], unknown["status"]) == ("Urgent", "Waiting For Customer")
+
+
+def test_is_unassigned_ticket_ignores_status_case():
+    base = {"assigned_group": "Network Team", "assignee": None}
+
+    assert backend_app_module._is_unassigned_ticket({**base, "status": "new"})
+    assert backend_app_module._is_unassigned_ticket({**base, "status": "Assigned"})
+    assert backend_app_module._is_unassigned_ticket({**base, "status": "NEW"})
+    assert not backend_app_module._is_unassigned_ticket({**base, "status": "In_Progress"})
+    assert not backend_app_module._is_unassigned_ticket({**base, "status": None})
+    assert not backend_app_module._is_unassigned_ticket({**base, "status": "new", "assignee": "Agent"})
+    assert not backend_app_module._is_unassigned_ticket({"status": "new", "assignee": None})
+    assert not backend_app_module._is_unassigned_ticket({})
+    assert not backend_app_module._is_unassigned_ticket({**base, "status": 1})
+    assert not backend_app_module._is_unassigned_ticket({**base, "status": ["new"]})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -20,13 +20,12 @@ from usecase_demo import (
 
 class UsecaseDemoRunServiceTests(unittest.IsolatedAsyncioTestCase):
     async def _wait_for_terminal_state(self, service: UsecaseDemoRunService, run_id: str) -> object:
-        deadline = asyncio.get_running_loop().time() + 2.0
-        while asyncio.get_running_loop().time() < deadline:
-            run = await service.get_run(run_id)
-            if run and run.status in (UsecaseDemoRunStatus.COMPLETED, UsecaseDemoRunStatus.FAILED):
-                return run
-            await asyncio.sleep(0.01)
-        self.fail("run did not reach terminal state in time")
+        try:
+            run = await asyncio.wait_for(service.wait_for_run(run_id), timeout=2.0)
+        except asyncio.TimeoutError:
+            self.fail("run did not reach terminal state in time")
+        self.assertIn(run.status, (UsecaseDemoRunStatus.COMPLETED, UsecaseDemoRunStatus.FAILED))
+        return run
 
     async def test_run_completes_with_rows(self):
         service = UsecaseDemoRunService()
@@ -511,20 +511,24 @@ def get_sla_breach_report(
         SlaBreachStatus.UNKNOWN: 3,
     }
 
-    filtered = [
-        i for i in infos
-        if i.breach_status in (SlaBreachStatus.BREACHED, SlaBreachStatus.AT_RISK)
-        or (include_ok and i.breach_status == SlaBreachStatus.OK)
-    ]
+    # Filter and count in one pass instead of re-walking the sorted list
+    filtered = []
+    total_breached = 0
+    total_at_risk = 0
+    for i in infos:
+        if i.breach_status == SlaBreachStatus.BREACHED:
+            total_breached += 1
+        elif i.breach_status == SlaBreachStatus.AT_RISK:
+            total_at_risk += 1
+        elif not (include_ok and i.breach_status == SlaBreachStatus.OK):
+            continue
+        filtered.append(i)
 
     sorted_infos = sorted(
         filtered,
         key=lambda i: (group_order[i.breach_status], -i.age_hours),
     )
 
-    total_breached = sum(1 for i in sorted_infos if i.breach_status == SlaBreachStatus.BREACHED)
-    total_at_risk = sum(1 for i in sorted_infos if i.breach_status == SlaBreachStatus.AT_RISK)
-
     return SlaBreachReport(
         reference_timestamp=reference_time.isoformat(),
         total_breached=total_breached,
@@ -143,6 +143,7 @@ class UsecaseDemoRunService:
 
     def __init__(self) -> None:
         self._runs: dict[str, UsecaseDemoRun] = {}
+        self._finished: dict[str, asyncio.Event] = {}
         self._lock = asyncio.Lock()
 
     async def create_run(self, payload: UsecaseDemoRunCreate) -> UsecaseDemoRun:
@@ -150,6 +151,7 @@ class UsecaseDemoRunService:
         run = UsecaseDemoRun(id=str(uuid4()), prompt=payload.prompt)
         async with self._lock:
             self._runs[run.id] = run
+            self._finished[run.id] = asyncio.Event()
 
         asyncio.create_task(self._execute_run(run.id))
         return run
@@ -160,6 +162,14 @@ class UsecaseDemoRunService:
             run = self._runs.get(run_id)
             return run.model_copy() if run else None
 
+    async def wait_for_run(self, run_id: str) -> UsecaseDemoRun | None:
+        """Wait until a run reaches a terminal state, then return it."""
+        finished = self._finished.get(run_id)
+        if finished is None:
+            return None
+        await finished.wait()
+        return await self.get_run(run_id)
+
     async def list_runs(self, limit: int = 20) -> list[UsecaseDemoRun]:
         """List most recent runs first."""
         normalized_limit = min(max(limit, 1), 200)
@@ -180,6 +190,15 @@ class UsecaseDemoRunService:
             self._runs[run_id] = run.model_copy(update=updates)
 
     async def _execute_run(self, run_id: str) -> None:
+        """Run the agent, then wake anyone waiting on the run."""
+        try:
+            await self._run_to_completion(run_id)
+        finally:
+            finished = self._finished.get(run_id)
+            if finished is not None:
+                finished.set()
+
+    async def _run_to_completion(self, run_id: str) -> None:
         """Run the agent and persist terminal status and parsed output."""
         run = await self.get_run(run_id)
         if run is None: